@@ -5,22 +5,52 @@ import random
 import traceback
 import typing
 import logging
-import asyncio
 
 import emojis
 import disnake
 from alaric import AQ
 from alaric.comparison import EQ
 from disnake.ext import commands
+from pymongo import ReturnDocument
 
 if typing.TYPE_CHECKING:
     from pyro import Pyro
 
+VALID_EMOJIS: typing.FrozenSet[str] = frozenset(emojis.db.get_emoji_aliases().values())
+# Variation selector, zero width joiner, keycap and skin tones
+EMOJI_MODIFIERS: typing.FrozenSet[str] = frozenset(
+    "\ufe0f\u200d\u20e3" + "".join(chr(c) for c in range(0x1F3FB, 0x1F400))
+)
+
+
+def is_single_emoji(text: str) -> bool:
+    """Whether the text is exactly one unicode emoji, modifiers allowed."""
+    if text in VALID_EMOJIS:
+        return True
+
+    if emojis.count(text) != 1:
+        return False
+
+    (base,) = emojis.get(text)
+    return text.startswith(base) and all(
+        char in EMOJI_MODIFIERS for char in text[len(base) :]
+    )
+
 
 class Config(commands.Cog, name="Configuration"):
     def __init__(self, bot):
         self.bot: Pyro = bot
         self.logger = logging.getLogger(__name__)
+        self._cog_files: typing.Tuple[str, ...] = ()
+        self._refresh_cog_files()
+
+    def _refresh_cog_files(self) -> None:
+        """Rescan ./cogs for loadable extension names."""
+        self._cog_files = tuple(
+            entry.name[:-3]
+            for entry in os.scandir("./cogs")
+            if entry.name.endswith(".py") and not entry.name.startswith("_")
+        )
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -38,10 +68,21 @@ class Config(commands.Cog, name="Configuration"):
         await self.bot.db.config.change_field_to(
             AQ(EQ("_id", ctx.guild.id)), "prefix", prefix
         )
+        self.bot.config_cache.delete_entry(ctx.guild.id)
         await ctx.send(
             f"The guild prefix has been set to `{prefix}`. Use `{prefix}prefix [prefix]` to change it again!"
         )
 
+    def _reload_one(self, name: str) -> typing.Optional[Exception]:
+        """Reload a single cog, returning any error rather than raising it."""
+        try:
+            self.bot.unload_extension(f"cogs.{name}")
+            self.bot.load_extension(f"cogs.{name}")
+        except Exception as e:
+            return e
+
+        return None
+
     @commands.command(
         name="reload",
         description="Reload all/one of the bots cogs!",
@@ -57,19 +98,15 @@ class Config(commands.Cog, name="Configuration"):
                     timestamp=ctx.message.created_at,
                 )
                 description = ""
-                for ext in os.listdir("./cogs/"):
-                    if ext.endswith(".py") and not ext.startswith("_"):
-                        try:
-                            self.bot.unload_extension(f"cogs.{ext[:-3]}")
-                            await asyncio.sleep(0.5)
-                            self.bot.load_extension(f"cogs.{ext[:-3]}")
-                            description += f"Reloaded: `{ext}`\n"
-                        except Exception as e:
-                            embed.add_field(
-                                name=f"Failed to reload: `{ext}`",
-                                value=e,
-                            )
-                    await asyncio.sleep(0.5)
+                for name in self._cog_files:
+                    error = self._reload_one(name)
+                    if error is None:
+                        description += f"Reloaded: `{name}.py`\n"
+                    else:
+                        embed.add_field(
+                            name=f"Failed to reload: `{name}.py`",
+                            value=error,
+                        )
                 embed.description = description
                 await ctx.send(embed=embed)
         else:
@@ -81,15 +118,18 @@ class Config(commands.Cog, name="Configuration"):
                 )
                 cog = cog.lower()
                 ext = f"{cog}.py"
-                if not os.path.exists(f"./cogs/{ext}"):
+                if cog not in self._cog_files:
+                    # The file may have been added since we last looked
+                    self._refresh_cog_files()
+
+                if cog not in self._cog_files:
                     embed.add_field(
                         name=f"Failed to reload: `{ext}`",
                         value="This cog file does not exist.",
                     )
-                elif ext.endswith(".py") and not ext.startswith("_"):
+                else:
                     try:
                         self.bot.unload_extension(f"cogs.{ext[:-3]}")
-                        await asyncio.sleep(0.5)
                         self.bot.load_extension(f"cogs.{ext[:-3]}")
                         embed.description = f"Reloaded: `{ext}`"
                     except Exception:
@@ -98,7 +138,6 @@ class Config(commands.Cog, name="Configuration"):
                             name=f"Failed to reload: `{ext}`",
                             value=desired_trace,
                         )
-                await asyncio.sleep(0.5)
             await ctx.send(embed=embed)
 
     @commands.group(
@@ -119,21 +158,22 @@ class Config(commands.Cog, name="Configuration"):
     @commands.guild_only()
     @commands.has_permissions(manage_messages=True)
     async def sb_toggle(self, ctx):
-        data = await self.bot.db.config.find(AQ(EQ("_id", ctx.guild.id)))
+        # Flip the value inside mongo so the read and write are one atomic operation
+        data = await self.bot.db.config.raw_collection.find_one_and_update(
+            {"_id": ctx.guild.id},
+            [{"$set": {"starboard_toggle": {"$not": ["$starboard_toggle"]}}}],
+            return_document=ReturnDocument.AFTER,
+        )
+        self.bot.config_cache.delete_entry(ctx.guild.id)
         if not data:
             return await ctx.send(
                 "You have not setup the starboard for this guild, please use the `starboard channel` command to do so."
             )
 
-        if not data.get("starboard_toggle"):
-            data = True
+        if data["starboard_toggle"]:
             await ctx.send("I have turned the starboard `on` for you.")
         else:
-            data = False
             await ctx.send("I have turned the starboard `off` for you.")
-        await self.bot.db.config.change_field_to(
-            AQ(EQ("_id", ctx.guild.id)), "starboard_toggle", data
-        )
 
     @starboard.command(
         name="channel",
@@ -149,25 +189,22 @@ class Config(commands.Cog, name="Configuration"):
             )
 
         channel = channel or ctx.channel
-        try:
-            await channel.send("test", delete_after=0.05)
-        except disnake.HTTPException:
+        perms = channel.permissions_for(ctx.guild.me)
+        if not perms.send_messages or not perms.embed_links:
             await ctx.send(
                 "I can not send a message to that channel! Please give me permissions and try again."
             )
             return
 
-        data = await self.bot.db.config.find(AQ(EQ("_id", ctx.guild.id)))
-
-        if not data:
-            data = {
-                "_id": ctx.guild.id,
-                "starboard_toggle": True,
-            }
-
-        data["starboard_channel"] = channel.id
-
-        await self.bot.db.config.upsert(AQ(EQ("_id", ctx.guild.id)), data)
+        await self.bot.db.config.raw_collection.update_one(
+            {"_id": ctx.guild.id},
+            {
+                "$set": {"starboard_channel": channel.id},
+                "$setOnInsert": {"starboard_toggle": True},
+            },
+            upsert=True,
+        )
+        self.bot.config_cache.delete_entry(ctx.guild.id)
         await ctx.send("I have set the starboard channel for this guild!")
 
     @starboard.command(
@@ -181,6 +218,7 @@ class Config(commands.Cog, name="Configuration"):
             await self.bot.db.config.upsert(
                 AQ(EQ("_id", ctx.guild.id)), {"_id": ctx.guild.id, "emoji": None}
             )
+            self.bot.config_cache.delete_entry(ctx.guild.id)
             await ctx.send("Reset your server's custom emoji.")
         elif isinstance(emoji, disnake.Emoji):
             if not emoji.is_usable():
@@ -190,14 +228,15 @@ class Config(commands.Cog, name="Configuration"):
             await self.bot.db.config.upsert(
                 AQ(EQ("_id", ctx.guild.id)), {"_id": ctx.guild.id, "emoji": str(emoji)}
             )
+            self.bot.config_cache.delete_entry(ctx.guild.id)
 
             await ctx.send("Added your emoji.")
         else:
-            emos = emojis.get(emoji)
-            if emos:
+            if is_single_emoji(emoji):
                 await self.bot.db.config.upsert(
                     AQ(EQ("_id", ctx.guild.id)), {"_id": ctx.guild.id, "emoji": emoji}
                 )
+                self.bot.config_cache.delete_entry(ctx.guild.id)
 
                 await ctx.send("Added your emoji.")
             else:
@@ -212,12 +251,14 @@ class Config(commands.Cog, name="Configuration"):
                 AQ(EQ("_id", ctx.guild.id)),
                 {"_id": ctx.guild.id, "emoji_threshold": None},
             )
+            self.bot.config_cache.delete_entry(ctx.guild.id)
             await ctx.send("Reset your server's custom emoji threshold.")
         else:
             await self.bot.db.config.upsert(
                 AQ(EQ("_id", ctx.guild.id)),
                 {"_id": ctx.guild.id, "emoji_threshold": thresh},
             )
+            self.bot.config_cache.delete_entry(ctx.guild.id)
 
             await ctx.send("Added your threshold.")
 
@@ -233,9 +274,7 @@ class Config(commands.Cog, name="Configuration"):
             color=random.randint(0, 0xFFFFFF),
         )
 
-        data = await self.bot.db.config.find(
-            AQ(EQ("_id", ctx.guild.id)),
-        )
+        data = await self.bot.get_guild_config(ctx.guild.id)
 
         if not data:
             return await ctx.send("This guild does not have anything saved.")
@@ -193,7 +193,8 @@ class Docs(commands.Cog, name="Documentation"):
             key = "nextcord"
 
         if query is not None:
-            if query.lower() == "rtfm":
+            lowered_query = query.lower()
+            if lowered_query == "rtfm":
                 await ctx.send(
                     embed=disnake.Embed.from_dict(
                         {
@@ -204,7 +205,7 @@ class Docs(commands.Cog, name="Documentation"):
                     )
                 )
 
-            elif query.lower() in {"developers", "devs"}:
+            elif lowered_query in {"developers", "devs"}:
                 await ctx.send(
                     embed=disnake.Embed.from_dict(
                         {
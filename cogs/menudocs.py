@@ -24,6 +24,10 @@ from pyro.checks import (
 log = logging.getLogger(__name__)
 
 BASE_MENUDOCS_URL = "https://github.com/menudocs"
+MAX_LINKS_PER_MESSAGE = 5
+# ##123 links an issue, $$123 links a pull request
+LINK_REGEX = re.compile(r"(?P<kind>##|\$\$)(?P<number>[0-9]+)\s?(?P<repo>[a-zA-Z0-9]*)")
+CODEBLOCK_REGEX = re.compile(r"```(?:[a-zA-Z0-9_+-]*\n)?(.*?)\n?```", re.DOTALL)
 
 
 def extract_repo(regex):
@@ -37,9 +41,6 @@ class MenuDocs(MenuDocsCog):
         self.bot: Pyro = bot
         self.logger = logging.getLogger(__name__)
 
-        self.issue_regex = re.compile(r"##(?P<number>[0-9]+)\s?(?P<repo>[a-zA-Z0-9]*)")
-        self.pr_regex = re.compile(r"\$\$(?P<number>[0-9]+)\s?(?P<repo>[a-zA-Z0-9]*)")
-
         # TODO Add a way to delete embeds
 
     @commands.Cog.listener()
@@ -52,19 +53,23 @@ class MenuDocs(MenuDocsCog):
             # Not in menudocs
             return
 
-        issue_regex = self.issue_regex.search(message.content)
-        if issue_regex is not None:
-            repo = extract_repo(issue_regex)
-            number = issue_regex.group("number")
-            url = f"{BASE_MENUDOCS_URL}/{repo}/issues/{number}"
-            await message.channel.send(url)
+        content = message.content
+        if "##" not in content and "$$" not in content:
+            # Cheap check so most messages never hit the regex engine
+            return
+
+        # Dict as an ordered set, capped so nobody can make us spam links
+        urls: dict[str, None] = {}
+        for link in LINK_REGEX.finditer(content):
+            repo = extract_repo(link)
+            number = link.group("number")
+            kind = "issues" if link.group("kind") == "##" else "pull"
+            urls[f"{BASE_MENUDOCS_URL}/{repo}/{kind}/{number}"] = None
+            if len(urls) >= MAX_LINKS_PER_MESSAGE:
+                break
 
-        pr_regex = self.pr_regex.search(message.content)
-        if pr_regex is not None:
-            repo = extract_repo(pr_regex)
-            number = pr_regex.group("number")
-            url = f"{BASE_MENUDOCS_URL}/{repo}/pull/{number}"
-            await message.channel.send(url)
+        if urls:
+            await message.channel.send("\n".join(urls))
 
     @commands.Cog.listener()
     async def on_thread_create(self, thread) -> None:
@@ -136,26 +141,7 @@ class MenuDocs(MenuDocsCog):
 
     def extract_code(self, message: disnake.Message) -> List[str]:
         """Extracts all codeblocks to str"""
-        content: List[str] = []
-        current = []
-        parsed_lst: List[str] = message.content.split("\n")
-
-        is_codeblock = False
-        for item in parsed_lst:
-            # Only keep items with content from codeblocks
-            if "```" in item:
-                is_codeblock = not is_codeblock
-
-                if not is_codeblock:
-                    content.append("\n".join(current))
-                    current = []
-
-                continue
-
-            if is_codeblock:
-                current.append(item)
-
-        return content
+        return CODEBLOCK_REGEX.findall(message.content)
 
     @commands.command(aliases=["hc", "huhcount"])
     @ensure_is_menudocs_project_guild()
@@ -166,10 +152,7 @@ class MenuDocs(MenuDocsCog):
             566133462986391553
         )
         async for message in channel.history():
-            try:
-                mappin[message.author] += 1
-            except KeyError:
-                mappin[message.author] = 1
+            mappin[message.author] = mappin.get(message.author, 0) + 1
 
         sorted_mappin: dict[disnake.Member, int] = dict(
             sorted(mappin.items(), key=lambda item: item[1], reverse=True)
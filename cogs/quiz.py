@@ -307,6 +307,7 @@ class Quiz(MenuDocsCog, name="Quiz"):
         await self.bot.db.config.upsert(
             AQ(EQ("_id", ctx.guild.id)), {"_id": ctx.guild.id, "quiz_role": role.id}
         )
+        self.bot.config_cache.delete_entry(ctx.guild.id)
         await ctx.send("Role added as a quiz role.")
 
 
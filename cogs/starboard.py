@@ -19,11 +19,8 @@ class Starboard(commands.Cog, name="Starboard"):
             # Only use this in guilds
             return
 
-        entries = await self.bot.db.config.get_all()
-        guilds = list(map(lambda e: e["_id"], entries))
-        if payload.guild_id in guilds:
-            guild = list(filter(lambda e: e["_id"] == payload.guild_id, entries))
-            guild = guild[0]
+        guild = await self.bot.get_guild_config(payload.guild_id)
+        if guild:
             emoji = guild.get("emoji") or "⭐"
 
             if not guild.get("starboard_channel"):
@@ -141,11 +138,8 @@ class Starboard(commands.Cog, name="Starboard"):
             # Only use this in guilds
             return
 
-        entries = await self.bot.db.config.get_all()
-        guilds = list(map(lambda e: e["_id"], entries))
-        if payload.guild_id in guilds:
-            guild = list(filter(lambda e: e["_id"] == payload.guild_id, entries))
-            guild = guild[0]
+        guild = await self.bot.get_guild_config(payload.guild_id)
+        if guild:
             emoji = guild.get("emoji") or "⭐"
 
             if not guild.get("starboard_channel"):
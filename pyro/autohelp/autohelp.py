@@ -109,20 +109,26 @@ class AutoHelp:
         except KeyError:
             return AUTO_HELP_CONF[-1]
 
+    def _help_embed(self, message: disnake.Message, description: str) -> disnake.Embed:
+        """Builds the standard auto help embed in response to the given message."""
+        return disnake.Embed.from_dict(
+            {
+                "description": description,
+                "timestamp": message.created_at.isoformat(),
+                "color": self.color,
+                "author": {
+                    "name": "Pyro Auto Helper",
+                    "icon_url": message.guild.me.display_avatar.url,
+                },
+                "footer": {
+                    "text": "Believe this is incorrect? Let Skelmis know in discord.gg/menudocs"
+                },
+            }
+        )
+
     async def build_embed(
         self, message: disnake.Message, errors: List[FormatError]
     ) -> disnake.Embed:
-        embed = disnake.Embed(
-            timestamp=message.created_at,
-            color=self.color,
-        )
-        embed.set_author(
-            name="Pyro Auto Helper", icon_url=message.guild.me.display_avatar.url
-        )
-        embed.set_footer(
-            text="Believe this is incorrect? Let Skelmis know in discord.gg/menudocs"
-        )
-
         data = {
             "created_for": {
                 "user_id": message.author.id,
@@ -131,9 +137,17 @@ class AutoHelp:
             "errors": [],
         }
 
-        for error in errors:
-            old_code_link = await self.upload_to_workbin(error.old_cst)
-            fixed_code_link = await self.upload_to_workbin(error.fixed_cst)
+        # Upload every snippet at once rather than waiting on each in turn
+        links = await asyncio.gather(
+            *(
+                self.upload_to_workbin(cst)
+                for error in errors
+                for cst in (error.old_cst, error.fixed_cst)
+            )
+        )
+        for error, old_code_link, fixed_code_link in zip(
+            errors, links[::2], links[1::2]
+        ):
             data["errors"].append(
                 {
                     "title": error.title,
@@ -154,13 +168,12 @@ class AutoHelp:
         assert r.status == 201, "Failed to create new auto-help resource"
         response_data = await r.json()
 
-        embed.description = (
+        return self._help_embed(
+            message,
             f"I've noticed this code has some issues and fixed them for you.\n\n"
-            f"You can find the fixed code [here]({response_data['view_url']})."
+            f"You can find the fixed code [here]({response_data['view_url']}).",
         )
 
-        return embed
-
     async def find_code(self, message: disnake.Message) -> Optional[List[str]]:
         """
         Parses the code out of the passed message.
@@ -1,4 +1,3 @@
-import re
 from typing import Dict, Callable
 
 from pyro.autohelp.regexes import vco_cf_worker_boi
@@ -27,7 +26,11 @@ class CodeBinExtractor:
         self.bot: Pyro = bot
 
     async def process(self, content: str) -> str:
-        is_vco_workers = re.search(self.vco_cf_worker_boi, content)
+        if "https://" not in content:
+            # No links, no pastes
+            return ""
+
+        is_vco_workers = self.vco_cf_worker_boi.search(content)
         if is_vco_workers:
             url = is_vco_workers.group("url")
             paste_id = is_vco_workers.group("id")
@@ -1,3 +1,4 @@
+import datetime
 import logging
 import os
 from traceback import format_exception
@@ -5,7 +6,11 @@ from typing import Optional, TYPE_CHECKING
 
 import disnake
 from aiohttp import ClientSession
+from alaric import AQ
+from alaric.comparison import EQ
 from bot_base import BotBase
+from bot_base.caches import TimedCache
+from bot_base.exceptions import NonExistentEntry
 from disnake.ext import commands
 from disnake.ext.commands import CommandNotFound
 
@@ -27,11 +32,27 @@ class Pyro(BotBase):
 
         super().__init__(*args, **kwargs)
 
+        # Guild config documents, cleared on write
+        self.config_cache: TimedCache = TimedCache()
+
         # Regex auto help
         self.auto_help: AutoHelp = AutoHelp(self)
 
         self.is_debug_mode = bool(os.environ.get("IS_LOCAL", False))
 
+    async def get_guild_config(self, guild_id: int) -> Optional[dict]:
+        """Fetch a guild's config, served from a short lived cache where possible."""
+        try:
+            return self.config_cache.get_entry(guild_id)
+        except NonExistentEntry:
+            pass
+
+        data = await self.db.config.find(AQ(EQ("_id", guild_id)))
+        self.config_cache.add_entry(
+            guild_id, data, ttl=datetime.timedelta(seconds=60), override=True
+        )
+        return data
+
     async def on_command_error(
         self, ctx: "BotContext", err: "DiscordException"
     ) -> None:
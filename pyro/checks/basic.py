@@ -19,18 +19,20 @@ AUXTAL_ACCOUNTS = {
 MAIN_GUILD = 416512197590777857
 PROJECT_GUILD = 566131499506860045
 AUXTAL_TESTING_GUILD = 888614043433197568
-MENUDOCS_GUILD_IDS = {MAIN_GUILD, PROJECT_GUILD, AUXTAL_TESTING_GUILD}
+MENUDOCS_GUILD_IDS = frozenset({MAIN_GUILD, PROJECT_GUILD, AUXTAL_TESTING_GUILD})
 MENUDOCS_SUGGESTIONS_CHANNEL = 516060828412280852  # suggestions
 MENUDOCS_PROJECTIONS_CHANNEL = 416518187576721419  # projections
 MENUDOCS_UNVERIFIED_ROLE = 594590703015821332  # Unverified
-PYTHON_HELP_CHANNEL_IDS = {
-    1024764221008920678,  # discord.py
-    1024765651547586642,  # python
-    702862760052129822,  # pyro
-    416522595958259713,  # commands (main dc)
-    888614043835830300,  # Auxtal testing channel
-    1024801821857939476,  # test-forum
-}
+PYTHON_HELP_CHANNEL_IDS = frozenset(
+    {
+        1024764221008920678,  # discord.py
+        1024765651547586642,  # python
+        702862760052129822,  # pyro
+        416522595958259713,  # commands (main dc)
+        888614043835830300,  # Auxtal testing channel
+        1024801821857939476,  # test-forum
+    }
+)
 CODE_REVIEWER, PROFICIENT, TEAM = {
     850330300595699733,  # Code Reviewer
     479199775590318080,  # Proficient
@@ -50,7 +52,7 @@ DISNAKE_ALLOWED_AUTOHELP_CHANNELS = {
     925508492574474270,
 }
 
-ALLOWED_HELP_CHANNELS = set.union(
+ALLOWED_HELP_CHANNELS = frozenset.union(
     PYTHON_HELP_CHANNEL_IDS,
     NEXTCORD_ALLOWED_AUTOHELP_CHANNELS,
     DISNAKE_ALLOWED_AUTOHELP_CHANNELS,
@@ -70,7 +72,7 @@ AUTO_HELP_ROLES = {
     },
 }
 
-AUTOHELP_ALLOWED_DISCORDS = set.union(MENUDOCS_GUILD_IDS, NEXTCORD_ID, DISNAKE_ID)
+AUTOHELP_ALLOWED_DISCORDS = frozenset.union(MENUDOCS_GUILD_IDS, NEXTCORD_ID, DISNAKE_ID)
 COMBINED_ACCOUNTS = set.union(SKELMIS_ACCOUNTS, AUXTAL_ACCOUNTS)
 
 